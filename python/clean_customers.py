@@ -1,19 +1,19 @@
 import pandas as pd
 import numpy as np
 
+from standard_clean import drop_duplicate_ids, normalize_text, standardize_id_fast
+
 def clean_customers(df):
-    # 1. Create a local copy to break the link to the slice
-    df = df.copy()
-    
-    # 2. Use .loc for explicit assignment
+    # Use .loc for explicit assignment
     # Extract digits, remove leading zeros, add 'cust-'
-    extracted = df['customer_code'].astype(str).str.extract(r'(\d+)')[0].fillna('0')
-    df.loc[:, 'customer_code'] = 'cust-' + extracted.astype(int).astype(str)
-    
-    # Clean segments
-    df.loc[:, 'customer_segment'] = df['customer_segment'].str.lower().str.strip()
-    
-    # 3. Drop duplicates and return the new DataFrame
-    df = df.drop_duplicates(subset=['customer_code'], keep='first').reset_index(drop=True)
-    
+    df.loc[:, 'customer_code'] = standardize_id_fast(df['customer_code'], 'cust')
+
+    # Clean segments (few distinct values, so transform the uniques only)
+    df.loc[:, 'customer_segment'] = normalize_text(
+        df['customer_segment'], lambda vals: vals.str.lower().str.strip()
+    )
+
+    # Drop duplicates (on the integer ID) and return the new DataFrame
+    df = drop_duplicate_ids(df, 'customer_code', 'cust')
+
     return df
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from standard_clean import drop_duplicate_ids, normalize_text, standardize_id_fast
+
 
 def clean_products(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -10,22 +12,20 @@ def clean_products(df: pd.DataFrame) -> pd.DataFrame:
     - Ensure base_price is non-null, numeric, and >= 0
     - Drop duplicate product_code, keeping the first valid row
     """
-    df = df.copy()
-
-    # String clean-up
+    # String clean-up; category is low-cardinality, so clean its uniques only
     df["product_name"] = df["product_name"].astype(str).str.strip().str.title()
-    df["category"] = df["category"].astype(str).str.strip().str.title()
+    df["category"] = normalize_text(
+        df["category"], lambda vals: vals.str.strip().str.title()
+    )
 
     # Standardise product_code -> 'prd-<int>'
-    extracted = df["product_code"].astype(str).str.extract(r"(\d+)")[0].fillna("0")
-    df["product_code"] = "prd-" + extracted.astype(int).astype(str)
+    df["product_code"] = standardize_id_fast(df["product_code"], "prd")
 
-    # base_price: numeric, non-null, >= 0
+    # base_price: numeric, non-null, >= 0 — applied as one combined mask
     df["base_price"] = pd.to_numeric(df["base_price"], errors="coerce")
-    df = df[df["base_price"].notna()]           # drop rows with missing base_price
-    df = df[df["base_price"] >= 0]              # enforce non-negative
+    df = df.loc[df["base_price"].notna() & (df["base_price"] >= 0)]
 
-    # Drop duplicate products on product_code, keep the first occurrence
-    df = df.drop_duplicates(subset=["product_code"], keep="first").reset_index(drop=True)
+    # Drop duplicate products on the integer product ID, keep the first occurrence
+    df = drop_duplicate_ids(df, "product_code", "prd")
 
     return df
\ No newline at end of file
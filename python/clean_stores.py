@@ -1,6 +1,13 @@
 import pandas as pd
 import numpy as np
 
+from standard_clean import (
+    drop_duplicate_ids,
+    normalize_region_name,
+    normalize_text,
+    standardize_id_fast,
+)
+
 
 def clean_stores(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -10,33 +17,23 @@ def clean_stores(df: pd.DataFrame) -> pd.DataFrame:
     - Unique store_code
     Region names are normalised to match the regions dimension.
     """
-    df = df.copy()
-
-    df["state"] = df["state"].astype(str).str.strip().str.upper()
+    # state has ~50 distinct values, so clean the uniques only
+    df["state"] = normalize_text(df["state"], lambda vals: vals.str.strip().str.upper())
 
     # Normalise region_name similarly to regions so FK passes
-    df["region_name"] = (
-        df["region_name"]
-        .astype(str)
-        .str.lower()
-        .str.replace("region", "", regex=False)
-        .str.strip()
-        .str.title()
-    )
+    df["region_name"] = normalize_region_name(df["region_name"])
 
     # Standardise store_code -> 'store-<int>'
-    extracted = df["store_code"].astype(str).str.extract(r"(\d+)")[0].fillna("0")
-    df["store_code"] = "store-" + extracted.astype(int).astype(str)
+    df["store_code"] = standardize_id_fast(df["store_code"], "store")
 
     df["city"] = df["city"].astype(str).str.strip().str.title()
     df["store_name"] = df["store_name"].astype(str).str.strip().str.title()
 
-    # square_feet: numeric, non-null, >= 1
+    # square_feet: numeric, non-null, >= 1 — applied as one combined mask
     df["square_feet"] = pd.to_numeric(df["square_feet"], errors="coerce")
-    df = df[df["square_feet"].notna()]          # drop rows with missing size
-    df = df[df["square_feet"] >= 1]             # enforce positive area
+    df = df.loc[df["square_feet"].notna() & (df["square_feet"] >= 1)]
 
-    # De-duplicate by store_code
-    df = df.drop_duplicates(subset=["store_code"], keep="first").reset_index(drop=True)
+    # De-duplicate by the integer store ID
+    df = drop_duplicate_ids(df, "store_code", "store")
 
     return df
\ No newline at end of file
@@ -1,13 +1,15 @@
 """
-Load (already-cleaned) CSVs into Postgres "raw" tables.
+Load (already-cleaned) Parquet files into Postgres "raw" tables.
 - Reads config from .env
 - Creates raw schema if missing
-- Loads all CSVs from a directory into raw.<table_name>
-- Uses chunked loads for large files
+- Loads all Parquet files from a directory into raw.<table_name>
+- Uses batched loads for large files
 - No cleaning/validation logic here (handled upstream by your ingestion.py pipeline)
 
 """
 
+import functools
+import io
 import logging
 import os
 import re
@@ -15,6 +17,10 @@ from pathlib import Path
 from typing import List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
+from psycopg2.extras import execute_values
 from sqlalchemy import create_engine, text, MetaData, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
@@ -35,12 +41,20 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "").strip()
-DATA_DIR = os.getenv("DATA_DIR", "data/cleaned")          # where cleaned CSVs live
+DATA_DIR = os.getenv("DATA_DIR", "data/cleaned")          # where cleaned Parquet files live
 RAW_SCHEMA = os.getenv("RAW_SCHEMA", "raw")              # target schema for raw tables
 IF_EXISTS = os.getenv("IF_EXISTS", "replace").lower()    # replace | append
 CHUNKSIZE = int(os.getenv("CHUNKSIZE", "50000"))
-CSV_GLOB = os.getenv("CSV_GLOB", "*.csv")                # e.g., "*.csv"
+FILE_GLOB = os.getenv("FILE_GLOB", "*.parquet")          # e.g., "*.parquet"
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))         # retry attempts for transient failures
+# Raw tables are rebuilt on every run, so durability is expendable:
+# UNLOGGED tables and async commit skip the WAL fsync traffic.
+RAW_UNLOGGED = os.getenv("RAW_UNLOGGED", "true").lower() in {"1", "true", "yes"}
+# COPY FROM STDIN is the default write path. The execute_values fallback
+# also needs a psycopg2 cursor, so it can't be selected by driver
+# detection — it's an explicit opt-out for deployments where COPY is
+# blocked (e.g. some connection poolers).
+RAW_USE_COPY = os.getenv("RAW_USE_COPY", "true").lower() in {"1", "true", "yes"}
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is required in your .env file")
@@ -49,18 +63,27 @@ if not DATABASE_URL:
 
 # HELPERS
 
+# Compiled once at import; snake_case is called per column per file.
+_NON_WORD_RE = re.compile(r"[^\w]+")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+_DUP_UNDERSCORE_RE = re.compile(r"_+")
+# PostgreSQL identifiers: letters, digits, underscores; must start with a
+# letter or underscore.
+_IDENT_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
+@functools.lru_cache(maxsize=1024)
 def snake_case(name: str) -> str:
-    """Convert string to snake_case."""
+    """Convert string to snake_case. Cached — the same names recur per run."""
     name = name.strip()
-    name = re.sub(r"[^\w]+", "_", name)
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
-    return re.sub(r"_+", "_", name).strip("_").lower()
+    name = _NON_WORD_RE.sub("_", name)
+    name = _CAMEL_RE.sub(r"\1_\2", name)
+    return _DUP_UNDERSCORE_RE.sub("_", name).strip("_").lower()
 
 
 def validate_schema_name(schema: str) -> bool:
     """Validate schema name to prevent SQL injection."""
-    # PostgreSQL identifiers can contain letters, digits, underscores, and must start with letter/underscore
-    return bool(re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', schema))
+    return bool(_IDENT_RE.match(schema))
 
 
 def build_engine() -> Engine:
@@ -91,13 +114,13 @@ def ensure_schema(engine: Engine, schema: str) -> None:
     logger.info(f"Schema '{schema}' ensured")
 
 
-def infer_table_name(csv_path: Path) -> str:
+def infer_table_name(path: Path) -> str:
     """
     Default behavior:
-      data/cleaned/cleaned_orders.csv -> cleaned_orders
+      data/cleaned/cleaned_orders.parquet -> cleaned_orders
     If you want to strip prefixes like 'cleaned_' or 'raw_', set TABLE_PREFIX_STRIP in .env.
     """
-    table_name = snake_case(csv_path.stem)
+    table_name = snake_case(path.stem)
 
     # Optional prefix stripping (comma-separated prefixes)
     prefixes = os.getenv("TABLE_PREFIX_STRIP", "").strip()
@@ -109,15 +132,15 @@ def infer_table_name(csv_path: Path) -> str:
     return table_name
 
 
-def list_csvs(data_dir: str, pattern: str) -> List[Path]:
-    """List all CSV files matching the pattern in the data directory."""
+def list_data_files(data_dir: str, pattern: str) -> List[Path]:
+    """List all data files matching the pattern in the data directory."""
     base = Path(data_dir)
     if not base.exists() or not base.is_dir():
         raise FileNotFoundError(f"DATA_DIR not found or not a directory: {data_dir}")
 
     files = sorted(base.glob(pattern))
     if not files:
-        raise RuntimeError(f"No CSV files matching '{pattern}' found in {data_dir}")
+        raise RuntimeError(f"No data files matching '{pattern}' found in {data_dir}")
 
     return files
 
@@ -137,79 +160,125 @@ def get_table_row_count(engine: Engine, schema: str, table: str) -> int:
         return 0
 
 
-def load_csv_to_raw(
+def copy_batch(cursor, batch, columns: List[str], schema: str, table: str) -> None:
+    """Stream an Arrow RecordBatch into Postgres via COPY FROM STDIN.
+
+    The batch is serialized column-wise by Arrow's CSV writer straight from
+    its contiguous buffers — no row-major pandas detour.
+    """
+    buf = io.BytesIO()
+    pa_csv.write_csv(
+        batch, buf, write_options=pa_csv.WriteOptions(include_header=False)
+    )
+    buf.seek(0)
+    quoted_cols = ", ".join(f'"{c}"' for c in columns)
+    cursor.copy_expert(
+        f'COPY "{schema}"."{table}" ({quoted_cols}) FROM STDIN WITH (FORMAT CSV)',
+        buf,
+    )
+
+
+def insert_batch(cursor, batch, columns: List[str], schema: str, table: str) -> None:
+    """Bulk insert used when RAW_USE_COPY=false disables the COPY path.
+
+    execute_values packs all rows of the batch into a single multi-VALUES
+    statement, the next-fastest path after COPY. Like copy_batch it
+    requires a psycopg2 cursor.
+    """
+    quoted_cols = ", ".join(f'"{c}"' for c in columns)
+    rows = zip(*(col.to_pylist() for col in batch.columns))
+    execute_values(
+        cursor,
+        f'INSERT INTO "{schema}"."{table}" ({quoted_cols}) VALUES %s',
+        rows,
+        page_size=10_000,
+    )
+
+
+def load_table_to_raw(
     engine: Engine,
-    csv_path: Path,
+    cursor,
+    path: Path,
     schema: str,
     table: str,
     if_exists: str,
     chunksize: int,
-) -> None:
-    """Load CSV file into PostgreSQL table with error handling and progress tracking."""
-    logger.info(f"Loading {csv_path.name} -> {schema}.{table}")
-    
+) -> int:
+    """Stream one Parquet file into PostgreSQL on the caller's transaction.
+
+    Uses native COPY FROM STDIN rather than INSERT statements: pandas only
+    renders the CREATE TABLE DDL once so column types are inferred, then
+    both the DDL and every data batch run on the caller's cursor — nothing
+    is committed here and nothing escapes the caller's transaction.
+    Returns the rows written (0 means the file was empty or unreadable and
+    no table was touched).
+    """
+    logger.info(f"Loading {path.name} -> {schema}.{table}")
+
     if not validate_schema_name(schema) or not validate_schema_name(table):
         raise ValueError(f"Invalid schema or table name: {schema}.{table}")
-    
-    # Get initial row count if appending
-    initial_count = 0
-    if if_exists == "append":
-        initial_count = get_table_row_count(engine, schema, table)
-    
+
     try:
         # Get total file size for progress estimation
-        file_size = csv_path.stat().st_size
+        file_size = path.stat().st_size
         logger.info(f"File size: {file_size / (1024*1024):.2f} MB")
-        
+
         first = True
         chunk_num = 0
         total_rows = 0
-        
-        # Use transaction for atomicity - all chunks of a file succeed or fail together
-        with engine.begin() as conn:
-            for chunk in pd.read_csv(csv_path, chunksize=chunksize):
-                chunk_num += 1
-                chunk_rows = len(chunk)
-                total_rows += chunk_rows
-                
-                # Minimal, safe normalization: column names only.
-                # All cleaning/validation is handled upstream in ingestion.py.
-                chunk.columns = [snake_case(str(c)) for c in chunk.columns]
-                
-                # Validate no empty column names
-                if any(not col or col.strip() == '' for col in chunk.columns):
-                    raise ValueError(f"CSV {csv_path.name} contains empty column names")
-                
-                mode = if_exists if first else "append"
-                
-                # Load chunk to database
-                chunk.to_sql(
-                    name=table,
-                    con=conn,  # Use connection from transaction
-                    schema=schema,
-                    if_exists=mode,
-                    index=False,
-                    method="multi",  # Faster bulk insert
-                )
-                
+
+        # COPY unless explicitly disabled; see RAW_USE_COPY above.
+        write_batch = copy_batch if RAW_USE_COPY else insert_batch
+
+        # Parquet is read column-wise in row batches; no text parsing on
+        # this side any more, just decompression into Arrow buffers.
+        pf = pq.ParquetFile(path)
+
+        # Column names are fixed for the whole file: normalize and
+        # validate them once from the Parquet schema, not per batch.
+        # All cleaning/validation is handled upstream in ingestion.py.
+        columns = [snake_case(str(c)) for c in pf.schema_arrow.names]
+        if any(not col or col.strip() == '' for col in columns):
+            raise ValueError(f"{path.name} contains empty column names")
+
+        for batch in pf.iter_batches(batch_size=chunksize):
+            chunk_num += 1
+            chunk_rows = batch.num_rows
+            total_rows += chunk_rows
+
+            if first:
+                # Create/replace the table on the caller's cursor so the
+                # DDL sits in the same transaction as the data and rolls
+                # back with it. pandas only renders the CREATE TABLE
+                # statement (keeping its type inference); nothing touches
+                # a second connection.
+                empty = pf.schema_arrow.empty_table().to_pandas()
+                empty.columns = columns
+                ddl = pd.io.sql.get_schema(empty, table, con=engine, schema=schema)
+                if if_exists == "replace":
+                    cursor.execute(f'DROP TABLE IF EXISTS "{schema}"."{table}"')
+                    if RAW_UNLOGGED:
+                        # Freshly (re)created raw table: skip WAL logging
+                        # from the start.
+                        ddl = ddl.replace("CREATE TABLE", "CREATE UNLOGGED TABLE", 1)
+                    cursor.execute(ddl)
+                else:
+                    cursor.execute(
+                        ddl.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1)
+                    )
                 first = False
-                logger.info(f"  Chunk {chunk_num}: {chunk_rows:,} rows loaded (total: {total_rows:,})")
-        
-        # Verify final row count
-        final_count = get_table_row_count(engine, schema, table)
-        rows_added = final_count - initial_count
-        
-        logger.info(f"✅ Finished {schema}.{table} - {total_rows:,} rows loaded, {final_count:,} total rows in table")
-        
-        if if_exists == "replace" and final_count != total_rows:
-            logger.warning(f"⚠️  Row count mismatch: expected {total_rows:,}, got {final_count:,}")
-        elif if_exists == "append" and rows_added != total_rows:
-            logger.warning(f"⚠️  Row count mismatch: expected {total_rows:,} added, got {rows_added:,}")
-            
-    except pd.errors.EmptyDataError:
-        logger.warning(f"⚠️  {csv_path.name} is empty, skipping")
+
+            write_batch(cursor, batch, columns, schema, table)
+            logger.info(f"  Chunk {chunk_num}: {chunk_rows:,} rows loaded (total: {total_rows:,})")
+
+        logger.info(f"✅ Finished {schema}.{table} - {total_rows:,} rows staged")
+        return total_rows
+
+    except pa.ArrowInvalid:
+        logger.warning(f"⚠️  {path.name} is empty, skipping")
+        return 0
     except Exception as e:
-        logger.error(f"❌ Failed to load {csv_path.name}: {str(e)}")
+        logger.error(f"❌ Failed to load {path.name}: {str(e)}")
         raise
 
 
@@ -246,45 +315,76 @@ def main() -> None:
         
         ensure_schema(engine, RAW_SCHEMA)
         
-        csv_files = list_csvs(DATA_DIR, CSV_GLOB)
+        data_files = list_data_files(DATA_DIR, FILE_GLOB)
         
         logger.info("Load-to-DB config:")
         logger.info(f"  DATA_DIR    : {DATA_DIR}")
-        logger.info(f"  CSV_GLOB    : {CSV_GLOB}")
+        logger.info(f"  FILE_GLOB   : {FILE_GLOB}")
         logger.info(f"  RAW_SCHEMA  : {RAW_SCHEMA}")
         logger.info(f"  IF_EXISTS   : {IF_EXISTS}")
         logger.info(f"  CHUNKSIZE   : {CHUNKSIZE:,}")
-        logger.info(f"  CSV files   : {len(csv_files)}")
+        logger.info(f"  Data files  : {len(data_files)}")
         logger.info("-" * 60)
         
-        # Process each file with error handling
-        successful = 0
-        failed = 0
-        
-        for csv_path in csv_files:
-            try:
-                table = infer_table_name(csv_path)
-                load_csv_to_raw(
+        # Snapshot pre-load counts so append loads can be verified after
+        # the commit.
+        initial_counts = {}
+        if IF_EXISTS == "append":
+            for path in data_files:
+                table = infer_table_name(path)
+                initial_counts[table] = get_table_row_count(engine, RAW_SCHEMA, table)
+
+        # One transaction for the whole load: a single commit fsync at the
+        # end instead of one per file, and either every table lands or
+        # none does. Planner stats are refreshed just before the commit.
+        expected_rows = {}
+        raw_conn = engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            # A lost commit here just means re-running the load; don't pay
+            # for synchronous WAL flushes on a throwaway landing schema.
+            cursor.execute("SET synchronous_commit = OFF")
+
+            for path in data_files:
+                table = infer_table_name(path)
+                n_rows = load_table_to_raw(
                     engine=engine,
-                    csv_path=csv_path,
+                    cursor=cursor,
+                    path=path,
                     schema=RAW_SCHEMA,
                     table=table,
                     if_exists=IF_EXISTS,
                     chunksize=CHUNKSIZE,
                 )
-                successful += 1
-            except Exception as e:
-                failed += 1
-                logger.error(f"❌ Failed to process {csv_path.name}: {str(e)}")
-                # Continue with next file instead of stopping
-                continue
-        
+                if n_rows == 0:
+                    # Empty or unreadable file: no table was created on
+                    # this run, so there is nothing to ANALYZE or verify.
+                    continue
+                expected_rows[table] = n_rows
+
+            for table in expected_rows:
+                cursor.execute(f'ANALYZE "{RAW_SCHEMA}"."{table}"')
+
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+        # Verify row counts now that everything is committed
+        for table, n_rows in expected_rows.items():
+            final_count = get_table_row_count(engine, RAW_SCHEMA, table)
+            rows_added = final_count - initial_counts.get(table, 0)
+            logger.info(f"✅ {RAW_SCHEMA}.{table}: {final_count:,} total rows in table")
+            if IF_EXISTS == "replace" and final_count != n_rows:
+                logger.warning(f"⚠️  Row count mismatch: expected {n_rows:,}, got {final_count:,}")
+            elif IF_EXISTS == "append" and rows_added != n_rows:
+                logger.warning(f"⚠️  Row count mismatch: expected {n_rows:,} added, got {rows_added:,}")
+
         logger.info("=" * 60)
-        logger.info(f"Load complete: {successful} successful, {failed} failed")
+        logger.info(f"Load complete: {len(expected_rows)} file(s) committed")
         logger.info("=" * 60)
-        
-        if failed > 0:
-            raise RuntimeError(f"{failed} file(s) failed to load. Check logs above for details.")
             
     except Exception as e:
         logger.error(f"❌ Fatal error: {str(e)}")
@@ -1,12 +1,114 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api.types import is_string_dtype
 
+# Pattern/token constants shared by the hot cleaning paths, defined once
+# at import rather than per call.
+_NON_DIGITS = r"\D+"
+_DATE_TOKENS = ("date", "_ts")
+
+
+def standardize_id_fast(series, prefix):
+    """
+    Normalise an ID column to '<prefix>-<int>' using Arrow compute kernels.
+
+    Strips every non-digit character, maps null/empty to the '0' sentinel and
+    drops leading zeros via an int round-trip — same semantics as the old
+    str.extract pipeline, but vectorized in C++ over Arrow string buffers
+    instead of a Python regex per row.
+    """
+    arr = pc.cast(pa.array(series, from_pandas=True), pa.string())
+    digits = pc.replace_substring_regex(arr, _NON_DIGITS, "")
+    # Nulls must become "" before the comparison: equal() propagates null
+    # and if_else would then emit null instead of the "0" sentinel.
+    digits = pc.fill_null(digits, "")
+    digits = pc.if_else(pc.equal(digits, ""), "0", digits)
+    nums = pc.cast(pc.cast(digits, pa.int64()), pa.string())
+    codes = pc.binary_join_element_wise(pa.scalar(prefix + "-"), nums, "")
+    return pd.Series(
+        pd.array(codes, dtype=pd.ArrowDtype(pa.string())), index=series.index
+    )
+
+
+def drop_duplicate_ids(df, col, prefix):
+    """
+    Keep the first row per normalized '<prefix>-<int>' ID.
+
+    Dedupes on the integer part of the code: np.unique over an int64 array
+    is far cheaper than the string hash table drop_duplicates would build,
+    and return_index gives the first occurrence of each ID directly.
+    """
+    nums = df[col].str.removeprefix(prefix + "-").astype("int64").to_numpy()
+    _, first_idx = np.unique(nums, return_index=True)
+    return df.iloc[np.sort(first_idx)].reset_index(drop=True)
+
+
+def normalize_text(series, transform):
+    """
+    Apply a vectorized string transform to a low-cardinality column via its
+    unique values only.
+
+    The column is factorized to categories once, the transform runs on the
+    handful of distinct values, and the result is broadcast back through
+    the integer codes — O(n_unique) string work instead of O(n_rows).
+    """
+    cats = pd.Categorical(series.astype(str))
+    transformed = transform(pd.Index(cats.categories)).to_numpy()
+    out = transformed[cats.codes]
+    # Nulls factorize to code -1, which fancy-indexing would wrap to the
+    # *last* category's value; put the nulls back explicitly.
+    return pd.Series(np.where(cats.codes == -1, None, out), index=series.index)
+
+
+def normalize_region_name(series):
+    """
+    Normalise region names to align with store region_name values
+    ('north region' -> 'North').
+
+    Region cardinality is tiny (a handful of values), so the
+    lower/replace/trim/title chain — still nested Arrow UTF-8 kernels in
+    one pass — runs over the unique values only and is broadcast back to
+    the rows through the category codes, like a lookup table.
+    """
+    cats = pd.Categorical(series.astype(str))
+    uniques = pa.array(cats.categories, type=pa.string())
+    out = pc.utf8_title(
+        pc.utf8_trim_whitespace(
+            pc.replace_substring(pc.utf8_lower(uniques), "region", "")
+        )
+    )
+    lookup = out.to_numpy(zero_copy_only=False)
+    # Same -1 wraparound hazard as normalize_text: keep nulls null rather
+    # than inventing whichever region sorts last.
+    result = np.where(cats.codes == -1, None, lookup[cats.codes])
+    return pd.Series(result, index=series.index)
+
+
+# Formats tried in order when sniffing a date column; a column typically
+# uses a single ISO-like format throughout.
+_DATE_FORMATS = ("ISO8601", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y")
+
+
+def _infer_datetime_format(sample):
+    """Return the first known format that parses every sampled value, else None."""
+    for fmt in _DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        if not parsed.isna().any():
+            return fmt
+    return None
+
 
 def auto_parse_dates(df_list):
     """
     Automatically parse any column whose name contains 'date' or '_ts' as datetime.
 
+    A small sample of each column is used to infer one shared format first,
+    so the conversion dispatches to pandas' fast C parser; format="mixed"
+    (slow per-element inference) is only the fallback for columns where no
+    single format fits.
+
     Handles pandas' new string dtype safely by:
     - casting string columns back to object before converting
     - assigning a datetime64 column in place
@@ -16,15 +118,22 @@ def auto_parse_dates(df_list):
         # Create an explicit copy to avoid the SettingWithCopyWarning
         df = df.copy()
 
-        date_cols = [col for col in df.columns if "date" in col.lower() or "_ts" in col.lower()]
+        date_cols = [
+            col
+            for col in df.columns
+            if any(tok in col.lower() for tok in _DATE_TOKENS)
+        ]
 
         for col in date_cols:
             # If the column is using pandas' StringDtype, cast to object first
             if is_string_dtype(df[col].dtype):
                 df[col] = df[col].astype("object")
 
+            sample = df[col].dropna().head(100)
+            fmt = _infer_datetime_format(sample) if not sample.empty else None
+
             # Convert to datetime; incompatibility with previous dtype is handled
-            df[col] = pd.to_datetime(df[col], format="mixed", errors="coerce")
+            df[col] = pd.to_datetime(df[col], format=fmt or "mixed", errors="coerce")
 
         processed_dfs.append(df)
 